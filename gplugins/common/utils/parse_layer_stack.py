@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 from gdsfactory.technology import LayerStack
 
@@ -16,11 +18,24 @@ def list_unique_layer_stack_z(
     Returns:
         Sorted set of z-coordinates for this layer_stack
     """
-    thicknesses = [layer.thickness for layer in layer_stack.layers.values()]
-    zmins = [layer.zmin for layer in layer_stack.layers.values()]
-    zmaxs = [sum(value) for value in zip(zmins, thicknesses)]
+    return list(
+        _unique_z(
+            tuple(
+                (layer.zmin, layer.thickness) for layer in layer_stack.layers.values()
+            )
+        )
+    )
 
-    return sorted(set(zmins + zmaxs))
+
+@functools.lru_cache(maxsize=8)
+def _unique_z(zmins_thicknesses: tuple[tuple[float, float], ...]) -> tuple[float, ...]:
+    """Sorted unique zmin and zmax values, cached for repeated calls with the same LayerStack."""
+    return tuple(
+        sorted(
+            {zmin for zmin, _ in zmins_thicknesses}
+            | {zmin + thickness for zmin, thickness in zmins_thicknesses}
+        )
+    )
 
 
 def map_unique_layer_stack_z(
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from gdsfactory.pdk import get_layer_stack
+
+from gplugins.common.utils.parse_layer_stack import list_unique_layer_stack_z
+
+
+def test_list_unique_layer_stack_z() -> None:
+    layer_stack = get_layer_stack()
+    zmins = [layer.zmin for layer in layer_stack.layers.values()]
+    zmaxs = [layer.zmin + layer.thickness for layer in layer_stack.layers.values()]
+
+    zs = list_unique_layer_stack_z(layer_stack)
+    assert zs == sorted(set(zmins + zmaxs))
+
+    zs.append(1e9)  # the cached result must not be shared with callers
+    assert list_unique_layer_stack_z(layer_stack) == sorted(set(zmins + zmaxs))
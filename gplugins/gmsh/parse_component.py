@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+from typing import NamedTuple
+
 import numpy as np
+import shapely
 from gdsfactory.technology import LayerLevel, LayerStack
 from shapely.affinity import scale
 from shapely.geometry import MultiPolygon
@@ -11,6 +15,27 @@ from shapely.ops import unary_union
 from gplugins.gmsh.parse_gds import to_polygons
 
 
+def _default_z_to_bias(
+    thickness: float, sidewall_angle: float | None, width_to_z: float | None
+) -> tuple[list[float], list[float]]:
+    """Equivalent z_to_bias of a layer defined by its sidewall angle."""
+    if sidewall_angle is None:
+        return ([0, 1], [0, 0])
+    buffer_magnitude = thickness * np.tan(np.radians(sidewall_angle))
+    return (
+        (
+            [0, width_to_z, 1],
+            [
+                1 * buffer_magnitude * width_to_z,
+                0,
+                -1 * buffer_magnitude * (1 - width_to_z),
+            ],
+        )
+        if width_to_z
+        else ([0, 1], [0, -1 * buffer_magnitude])
+    )
+
+
 def bufferize(layer_stack: LayerStack):
     """Convert layers without a z_to_bias to an equivalent z_to_bias.
 
@@ -19,27 +44,77 @@ def bufferize(layer_stack: LayerStack):
     """
     for layer in layer_stack.layers.values():
         if layer.z_to_bias is None:
-            if layer.sidewall_angle is None:
-                layer.z_to_bias = ([0, 1], [0, 0])
-            else:
-                buffer_magnitude = layer.thickness * np.tan(
-                    np.radians(layer.sidewall_angle)
-                )
-                layer.z_to_bias = (
-                    (
-                        [0, layer.width_to_z, 1],
-                        [
-                            1 * buffer_magnitude * layer.width_to_z,
-                            0,
-                            -1 * buffer_magnitude * (1 - layer.width_to_z),
-                        ],
-                    )
-                    if layer.width_to_z
-                    else ([0, 1], [0, -1 * buffer_magnitude])
-                )
+            layer.z_to_bias = _default_z_to_bias(
+                layer.thickness, layer.sidewall_angle, layer.width_to_z
+            )
     return layer_stack
 
 
+class BufferedLayer(NamedTuple):
+    """Immutable view of the LayerLevel fields needed to extrude a buffered prism."""
+
+    zmin: float
+    thickness: float
+    mesh_order: int | float | None
+    z_to_bias: tuple[tuple[float, ...], tuple[float, ...]]
+
+
+def _layer_stack_signature(layer_stack: LayerStack) -> tuple:
+    """Hashable signature of the LayerStack fields read by bufferize."""
+    return tuple(
+        (
+            layername,
+            layer.zmin,
+            layer.thickness,
+            layer.mesh_order,
+            layer.sidewall_angle,
+            layer.width_to_z,
+            None
+            if layer.z_to_bias is None
+            else (tuple(layer.z_to_bias[0]), tuple(layer.z_to_bias[1])),
+        )
+        for layername, layer in layer_stack.layers.items()
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _buffered_layers(signature: tuple) -> dict[str, BufferedLayer]:
+    buffered_layers = {}
+    for (
+        layername,
+        zmin,
+        thickness,
+        mesh_order,
+        sidewall_angle,
+        width_to_z,
+        z_to_bias,
+    ) in signature:
+        if z_to_bias is None:
+            z_to_bias = _default_z_to_bias(thickness, sidewall_angle, width_to_z)
+        buffered_layers[layername] = BufferedLayer(
+            zmin=zmin,
+            thickness=thickness,
+            mesh_order=mesh_order,
+            z_to_bias=(tuple(z_to_bias[0]), tuple(z_to_bias[1])),
+        )
+    return buffered_layers
+
+
+def buffered_layers(layer_stack: LayerStack) -> dict[str, BufferedLayer]:
+    """Cached, non-mutating equivalent of bufferize.
+
+    Repeated calls with an equal LayerStack (e.g. during a parameter sweep) reuse the previous result.
+    The returned dict is shared between calls and must not be modified.
+
+    Arguments:
+        layer_stack: layer_stack to process
+
+    Returns:
+        dict of layername: BufferedLayer, in layer_stack order
+    """
+    return _buffered_layers(_layer_stack_signature(layer_stack))
+
+
 def process_buffers(layer_polygons_dict: dict, layer_stack: LayerStack):
     """Break up layers into sub-layers according to z_to_bias.
 
@@ -165,6 +240,37 @@ def merge_by_material_func(layer_polygons_dict: dict, layer_stack: LayerStack):
     return merged_layer_polygons_dict
 
 
+def remove_small_polygons(layer_polygons_dict: dict, min_area: float) -> dict:
+    """Remove polygons whose area is smaller than min_area from every layer.
+
+    Degenerate slivers would otherwise be meshed as tiny gmsh entities.
+
+    Arguments:
+        layer_polygons_dict: dict of layernames: shapely (Multi)Polygons
+        min_area: polygons with a smaller area are removed
+
+    Returns:
+        new layer_polygons_dict, where layers without remaining polygons are empty
+    """
+    layernames = list(layer_polygons_dict.keys())
+    parts, index = shapely.get_parts(
+        list(layer_polygons_dict.values()), return_index=True
+    )
+    small = shapely.area(parts) < min_area
+    if not small.any():
+        return dict(layer_polygons_dict)
+
+    filtered_layer_polygons_dict = {}
+    for i, layername in enumerate(layernames):
+        if not small[index == i].any():
+            filtered_layer_polygons_dict[layername] = layer_polygons_dict[layername]
+        else:
+            filtered_layer_polygons_dict[layername] = MultiPolygon(
+                list(parts[(index == i) & ~small])
+            )
+    return filtered_layer_polygons_dict
+
+
 def create_2D_surface_interface(
     layer_polygons: MultiPolygon,
     thickness_min: float = 0.0,
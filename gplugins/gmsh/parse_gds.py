@@ -3,23 +3,17 @@
 from __future__ import annotations
 
 import gdsfactory as gf
+import numpy as np
 import shapely
 from shapely.geometry import LineString, MultiLineString, MultiPolygon, Polygon
 
 
 def round_coordinates(geom, ndigits=4):
-    """Round coordinates to n_digits to eliminate floating point errors."""
+    """Round coordinates to n_digits to eliminate floating point errors.
 
-    def _round_coords(x, y, z=None):
-        x = round(x, ndigits)
-        y = round(y, ndigits)
-
-        if z is not None:
-            z = round(x, ndigits)
-
-        return [c for c in (x, y, z) if c is not None]
-
-    return shapely.ops.transform(_round_coords, geom)
+    Accepts a single geometry or an array of geometries, whose coordinates are rounded in a single vectorized call.
+    """
+    return shapely.transform(geom, lambda coords: np.round(coords, ndigits))
 
 
 def fuse_polygons(component, layer, round_tol=4, simplify_tol=1e-4, offset_tol=None):
@@ -43,13 +37,12 @@ def fuse_polygons(component, layer, round_tol=4, simplify_tol=1e-4, offset_tol=N
             interior_points.append(holes_points)
 
         shapely_polygons.append(
-            round_coordinates(
-                shapely.geometry.Polygon(shell=exterior_points, holes=interior_points),
-                round_tol,
-            )
+            shapely.geometry.Polygon(shell=exterior_points, holes=interior_points)
         )
 
-    return shapely.ops.unary_union(shapely_polygons).simplify(
+    shapely_polygons = round_coordinates(shapely_polygons, round_tol)
+
+    return shapely.unary_union(shapely_polygons).simplify(
         simplify_tol, preserve_topology=False
     )
 
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import copy
+
+from gdsfactory.pdk import get_layer_stack
+from gdsfactory.technology import LayerStack
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from gplugins.gmsh.parse_component import (
+    buffered_layers,
+    bufferize,
+    remove_small_polygons,
+)
+
+
+def test_buffered_layers_matches_bufferize() -> None:
+    layer_stack = get_layer_stack()
+    filtered_layer_stack = LayerStack(
+        layers={
+            k: layer_stack.layers[k].model_copy() for k in ("box", "core", "slab90")
+        }
+    )
+    # the shared PDK layers may already have been bufferized in place by other tests
+    for layer in filtered_layer_stack.layers.values():
+        layer.z_to_bias = None
+    filtered_layer_stack.layers["core"].sidewall_angle = 10
+    filtered_layer_stack.layers["box"].z_to_bias = ([0, 1], [0, 0.1])
+    z_to_bias = copy.deepcopy(
+        {
+            layername: layer.z_to_bias
+            for layername, layer in filtered_layer_stack.layers.items()
+        }
+    )
+
+    layers = buffered_layers(filtered_layer_stack)
+    assert buffered_layers(filtered_layer_stack) is layers
+    assert {
+        layername: layer.z_to_bias
+        for layername, layer in filtered_layer_stack.layers.items()
+    } == z_to_bias
+
+    for layername, layer in bufferize(filtered_layer_stack).layers.items():
+        assert layers[layername].zmin == layer.zmin
+        assert layers[layername].thickness == layer.thickness
+        assert layers[layername].mesh_order == layer.mesh_order
+        assert layers[layername].z_to_bias == (
+            tuple(layer.z_to_bias[0]),
+            tuple(layer.z_to_bias[1]),
+        )
+
+
+def test_remove_small_polygons() -> None:
+    big, sliver = box(0, 0, 1, 1), box(2, 0, 2.001, 1e-3)
+    layer_polygons_dict = {
+        "core": MultiPolygon([big, sliver]),
+        "slab90": sliver,
+        "box": big,
+        "clad": Polygon(),
+    }
+
+    filtered = remove_small_polygons(layer_polygons_dict, min_area=1e-4)
+
+    assert filtered["core"].equals(big)
+    assert filtered["slab90"].is_empty
+    assert filtered["box"] is big
+    assert filtered["clad"].is_empty
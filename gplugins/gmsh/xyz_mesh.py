@@ -4,16 +4,15 @@ from pathlib import Path
 from typing import Any
 
 import gdsfactory as gf
+import gmsh
 import numpy as np
+import shapely
 from gdsfactory.config import get_number_of_cores
 from gdsfactory.technology import LayerLevel, LayerStack, LogicalLayer
 from gdsfactory.typings import ComponentOrReference
 from meshwell.gmsh_entity import GMSH_entity
 from meshwell.model import Model
 from meshwell.prism import Prism
-from shapely.affinity import scale
-from shapely.geometry import Polygon
-from shapely.ops import unary_union
 
 from gplugins.common.utils.get_component_with_net_layers import (
     get_component_with_net_layers,
@@ -21,9 +20,20 @@ from gplugins.common.utils.get_component_with_net_layers import (
 from gplugins.common.utils.parse_layer_stack import (
     list_unique_layer_stack_z,
 )
-from gplugins.gmsh.parse_component import bufferize
+from gplugins.gmsh.parse_component import buffered_layers, remove_small_polygons
 from gplugins.gmsh.parse_gds import cleanup_component
 
+# gmsh 3D meshing stops scaling (and can slow down) beyond ~16 threads
+_DEFAULT_N_THREADS = min(get_number_of_cores(), 16)
+
+# orientation: (port normal along x, x offset, y offset), offsets in units of the box dx and dy
+_EDGE_PORT_OFFSETS: dict[int, tuple[bool, float, float]] = {
+    0: (True, 0, -0.5),  # right of simulation
+    180: (True, -1, -0.5),  # left of simulation
+    90: (False, -0.5, 0),  # top of simulation
+    270: (False, -0.5, -1),  # bottom of simulation
+}
+
 
 def define_edgeport(
     port: gf.Port,
@@ -38,24 +48,15 @@ def define_edgeport(
     x, y = port.center
     width_pad = port_dict.get("width_pad") or 0
 
-    if port.orientation == 180:  # left of simulation
-        dx = 1
-        dy = port.width + 2 * width_pad
-        x -= dx
-        y -= dy / 2
-    elif port.orientation == 0:  # right of simulation
-        dx = 1
-        dy = port.width + 2 * width_pad
-        y -= dy / 2
-    elif port.orientation == 90:  # top of simulation
-        dx = port.width + 2 * width_pad
-        dy = 1
-        x -= dx / 2
-    elif port.orientation == 270:  # bottom of simulation
-        dx = port.width + 2 * width_pad
-        dy = 1
-        y -= dy
-        x -= dx / 2
+    if port.orientation not in _EDGE_PORT_OFFSETS:
+        raise ValueError(
+            f"Edge port {port.name!r} orientation {port.orientation} is not one of {list(_EDGE_PORT_OFFSETS)}"
+        )
+    normal_along_x, fx, fy = _EDGE_PORT_OFFSETS[port.orientation]
+    width = port.width + 2 * width_pad
+    dx, dy = (1, width) if normal_along_x else (width, 1)
+    x += fx * dx
+    y += fy * dy
 
     box = GMSH_entity(
         gmsh_function=model.occ.add_box,
@@ -92,42 +93,34 @@ def define_prisms(
         scale_factor: scaling factor to apply to the polygons (default: 1).
     """
     prisms_list: list[Prism] = []
-    buffered_layer_stack = bufferize(layer_stack)
 
     if resolutions is None:
         resolutions = {}
 
-    for layername in buffered_layer_stack.layers.keys():
-        if layer_polygons_dict[layername].is_empty:
+    for layername, layer_ in buffered_layers(layer_stack).items():
+        polygons = layer_polygons_dict[layername]
+        if polygons.is_empty:
             continue
+        if scale_factor != 1:
+            polygons = shapely.transform(polygons, lambda coords: coords * scale_factor)
 
-        layer_ = buffered_layer_stack.layers[layername]
+        coords = np.asarray(layer_.z_to_bias[0], dtype=np.float64)
+        buffers = np.asarray(layer_.z_to_bias[1], dtype=np.float64)
+        zs = coords * (layer_.thickness * scale_factor)
+        zs += layer_.zmin * scale_factor
+        buffers *= scale_factor
 
-        z_to_bias = layer_.z_to_bias
-
-        if z_to_bias is None:
-            continue
-
-        coords = np.array(z_to_bias[0])
-        zs = (
-            coords * buffered_layer_stack.layers[layername].thickness * scale_factor
-            + buffered_layer_stack.layers[layername].zmin * scale_factor
-        )
-        buffers = np.array(z_to_bias[1]) * scale_factor
-
-        buffer_dict = dict(zip(zs, buffers))
+        # meshwell Prism only accepts a {z: buffer} dict (no parallel arrays): build it from
+        # plain Python floats so that downstream lookups do not unbox numpy scalars
+        buffer_dict = dict(zip(zs.tolist(), buffers.tolist()))
 
         prisms_list.append(
             Prism(
-                polygons=scale(
-                    layer_polygons_dict[layername],
-                    *(scale_factor,) * 2,
-                    origin=(0, 0, 0),
-                ),
+                polygons=polygons,
                 buffers=buffer_dict,
                 model=model,
                 resolution=resolutions.get(layername, None),
-                mesh_order=buffered_layer_stack.layers.get(layername).mesh_order,
+                mesh_order=layer_.mesh_order,
                 physical_name=layer_physical_map[layername]
                 if layername in layer_physical_map
                 else layername,
@@ -151,12 +144,12 @@ def xyz_mesh(
     global_scaling: float = 1,
     global_scaling_premesh: float = 1,
     global_2D_algorithm: int = 6,
-    global_3D_algorithm: int = 1,
+    global_3D_algorithm: int = 10,
     filename: str | None = None,
     verbosity: int | None = 0,
     round_tol: int = 3,
     simplify_tol: float = 1e-3,
-    n_threads: int = get_number_of_cores(),
+    n_threads: int = _DEFAULT_N_THREADS,
     port_names: list[str] | None = None,
     edge_ports: list[str] | None = None,
     gmsh_version: float | None = None,
@@ -181,11 +174,14 @@ def xyz_mesh(
             Instead of using a gmsh-option which is only applied to meshes, this parameter can scale cad-exported files, e.g. .step files
         global_2D_algorithm: gmsh surface default meshing algorithm, see https://gmsh.info/doc/texinfo/gmsh.html#Mesh-options.
         global_3D_algorithm: gmsh volume default meshing algorithm, see https://gmsh.info/doc/texinfo/gmsh.html#Mesh-options.
+            Defaults to 10 (HXT), which meshes in parallel over n_threads if gmsh was built with OpenMP
+            (``-DENABLE_OPENMP=on``). Use 1 (Delaunay) for serial meshing with ill-shaped tetrahedra reporting.
         filename: where to save the .msh file.
         verbosity: gmsh verbosity level.
         round_tol: during gds --> mesh conversion cleanup, number of decimal points at which to round the gdsfactory/shapely points before introducing to gmsh
         simplify_tol: during gds --> mesh conversion cleanup, shapely "simplify" tolerance (make it so all points are at least separated by this amount)
-        n_threads: for gmsh parallelization
+        n_threads: for gmsh parallelization (General.NumThreads and Mesh.MaxNumThreads1D/2D/3D).
+            Defaults to the number of available cores, capped at 16.
         port_names: list or port polygons to converts into new layers (useful for boundary conditions)
         edge_ports: dict of port_names to define as a 2D surface at the edge of the simulation.
             edge_ports = {
@@ -205,10 +201,8 @@ def xyz_mesh(
         optimization_flags: list of tuples of optimization flags to pass to gmsh, e.g. [("Optimize", 1), ("OptimizeNetgen", 1)].
     """
     if port_names:
-        mesh_component = component.dup()
-        mesh_component.add_ports(component.ports)
         component = get_component_with_net_layers(
-            component=mesh_component,
+            component=component.dup(),  # dup() already copies the ports
             port_names=port_names,
             layer_stack=layer_stack,
             **(dict(delimiter=layer_port_delimiter) if layer_port_delimiter else {}),
@@ -220,40 +214,32 @@ def xyz_mesh(
         component, layer_stack, round_tol, simplify_tol
     )
 
+    # Drop slivers too small to be resolved at simplify_tol
+    layer_polygons_dict = remove_small_polygons(
+        layer_polygons_dict, min_area=simplify_tol**2
+    )
+
     # Add background polygon
     if background_tag is not None:
-        bbox = unary_union(list(layer_polygons_dict.values()))
-        bounds = bbox.bounds
+        # only the envelope is needed, so skip the (costly) union of all layers
+        bounds = shapely.total_bounds(list(layer_polygons_dict.values()))
 
         # get min and max z values in LayerStack
         zs = list_unique_layer_stack_z(layer_stack)
         zmin, zmax = np.min(zs), np.max(zs)
 
         # create Polygon encompassing simulation environment
-        layer_polygons_dict[background_tag] = scale(
-            Polygon(
-                [
-                    [
-                        bounds[0] - background_padding[0],
-                        bounds[1] - background_padding[1],
-                    ],
-                    [
-                        bounds[0] - background_padding[0],
-                        bounds[3] + background_padding[4],
-                    ],
-                    [
-                        bounds[2] + background_padding[3],
-                        bounds[3] + background_padding[4],
-                    ],
-                    [
-                        bounds[2] + background_padding[3],
-                        bounds[1] - background_padding[1],
-                    ],
-                ]
-            ),
-            *(global_scaling_premesh,) * 2,
-            origin=(0, 0, 0),
+        xmin = bounds[0] - background_padding[0]
+        ymin = bounds[1] - background_padding[1]
+        xmax = bounds[2] + background_padding[3]
+        ymax = bounds[3] + background_padding[4]
+        corners = np.array(
+            [[xmin, ymin], [xmin, ymax], [xmax, ymax], [xmax, ymin]],
+            dtype=np.float64,
         )
+        if global_scaling_premesh != 1:
+            corners *= global_scaling_premesh
+        layer_polygons_dict[background_tag] = shapely.polygons(corners[None])[0]
         layer_stack = LayerStack(
             layers=layer_stack.layers
             | {
@@ -273,7 +259,11 @@ def xyz_mesh(
         )
 
     # Meshwell Prisms from gdsfactory polygons and layer_stack
+    # Model sets General.NumThreads and Mesh.MaxNumThreads1D/2D/3D, and model.mesh the
+    # algorithms, but neither forwards verbosity to gmsh
     model = Model(n_threads=n_threads)
+    if verbosity is not None:
+        gmsh.option.setNumber("General.Verbosity", verbosity)
     prisms_list = define_prisms(
         layer_polygons_dict=layer_polygons_dict,
         layer_stack=layer_stack,
@@ -285,27 +275,17 @@ def xyz_mesh(
     )
 
     # Add edgeports
-    if edge_ports is not None:
+    if edge_ports:
         ports = component.ports
-        for portname, edge_ports_dict in edge_ports.items():
-            port = ports[portname]
-            prisms_list.append(
-                define_edgeport(
-                    port,
-                    edge_ports_dict,
-                    model,
-
-                )
-            )
-    import copy
-
-    resolutions = copy.deepcopy(resolutions)
+        prisms_list.extend(
+            define_edgeport(ports[portname], edge_ports_dict, model)
+            for portname, edge_ports_dict in edge_ports.items()
+        )
 
-    if resolutions:
-        for r in resolutions.values():
-            r["resolution"] *= global_scaling_premesh
-    else:
-        resolutions = {}
+    resolutions = {
+        k: {**v, "resolution": v["resolution"] * global_scaling_premesh}
+        for k, v in (resolutions or {}).items()
+    }
 
     return model.mesh(
         entities_list=prisms_list,